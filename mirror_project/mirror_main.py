@@ -6,12 +6,20 @@ from pathlib import Path
 
 import cv2
 
-from src.capture import CaptureSession, CaptureConfig
+from src.capture import CaptureSession, CaptureConfig, FrameGrabber
 from src.body_tracking import PoseEstimator
-from src.overlay import OverlayRenderer
+from src.inference import load_pose_backend
+from src.overlay import DepthColorizer, DisplayBuffer, OverlayRenderer
 from src.utils import ensure_directory
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Smart mirror capture and overlay demo")
     parser.add_argument(
@@ -24,48 +32,87 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="Optional path to store annotated output video",
     )
+    parser.add_argument(
+        "--model",
+        type=Path,
+        help="Optional pose landmark model (.onnx, or a TensorRT .plan/.engine) "
+        "to run instead of MediaPipe. Only these models crop inference to the "
+        "tracked pose region; MediaPipe always processes the full frame",
+    )
+    parser.add_argument(
+        "--depth-interval",
+        type=_positive_int,
+        default=2,
+        help="Refresh the depth preview every N frames (default: 2)",
+    )
+    parser.add_argument(
+        "--single-window",
+        action="store_true",
+        help="Show color and depth side by side in one window instead of two",
+    )
+    parser.add_argument(
+        "--opencl",
+        action="store_true",
+        help="Run drawing and depth colorization through OpenCV's OpenCL (T-API) path",
+    )
     return parser.parse_args()
 
 
 def main() -> None:  # pragma: no cover - interactive demo
     args = parse_args()
+    use_opencl = args.opencl and cv2.ocl.haveOpenCL()
+    cv2.ocl.setUseOpenCL(use_opencl)
     renderer = OverlayRenderer()
-    estimator = PoseEstimator()
+    colorizer = DepthColorizer(use_opencl=use_opencl)
+    display = DisplayBuffer() if args.single_window else None
+    backend = load_pose_backend(args.model) if args.model else None
+    estimator = PoseEstimator(backend=backend)
 
     config = CaptureConfig(playback_file=args.playback)
     output_writer = None
 
-    if args.record_out:
-        ensure_directory(args.record_out.parent)
+    try:
+        if args.record_out:
+            ensure_directory(args.record_out.parent)
+            # The pipeline enforces the configured color resolution, so the writer
+            # can be created up front instead of being checked for on every frame.
+            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+            stream = config.color_stream
+            output_writer = cv2.VideoWriter(
+                str(args.record_out), fourcc, stream.fps, (stream.width, stream.height)
+            )
+            if not output_writer.isOpened():
+                raise RuntimeError(f"Could not open {args.record_out} for writing")
 
-    with CaptureSession(config) as session:
-        try:
-            for color, depth in session.frames():
+        # The estimator and renderer (the consumer side) are ready before the
+        # producer thread starts pulling frames, so the first pair is not stalled.
+        with CaptureSession(config) as session, FrameGrabber(session) as grabber:
+            for frame_index, (color, depth) in enumerate(grabber.frames()):
                 pose = estimator.estimate(color)
-                annotated = renderer.render(color, pose) if pose else color
-
-                if args.record_out:
-                    if output_writer is None:
-                        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-                        height, width, _ = annotated.shape
-                        output_writer = cv2.VideoWriter(
-                            str(args.record_out), fourcc, config.color_stream.fps, (width, height)
-                        )
+                frame = cv2.UMat(color) if use_opencl else color
+                annotated = renderer.render(frame, pose) if pose else frame
+
+                if output_writer is not None:
                     output_writer.write(annotated)
 
-                depth_colormap = cv2.applyColorMap(
-                    cv2.convertScaleAbs(depth, alpha=0.03),
-                    cv2.COLORMAP_JET,
-                )
-                combined = cv2.hconcat([annotated, depth_colormap])
-                cv2.imshow("Smart Mirror", combined)
+                # The depth view is cosmetic, so refresh it at a lower rate than inference.
+                depth_colormap = None
+                if frame_index % args.depth_interval == 0:
+                    depth_colormap = colorizer.colorize(depth)
+                if display is not None:
+                    cv2.imshow("Smart Mirror", display.compose(annotated, depth_colormap))
+                else:
+                    # Separate windows avoid composing a double-width frame each iteration.
+                    cv2.imshow("Smart Mirror", annotated)
+                    if depth_colormap is not None:
+                        cv2.imshow("Depth", depth_colormap)
                 if cv2.waitKey(1) == 27:
                     break
-        finally:
-            if output_writer is not None:
-                output_writer.release()
-            cv2.destroyAllWindows()
-            estimator.close()
+    finally:
+        if output_writer is not None:
+            output_writer.release()
+        cv2.destroyAllWindows()
+        estimator.close()
 
 
 if __name__ == "__main__":  # pragma: no cover - script entry
@@ -1,12 +1,20 @@
 """Source package for the smart mirror project."""
 
-from .capture import CaptureSession, CaptureConfig
-from .body_tracking import PoseEstimator
-from .overlay import OverlayRenderer
+from .capture import CaptureSession, CaptureConfig, FrameGrabber
+from .body_tracking import MediaPipeBackend, PoseEstimator
+from .inference import OnnxPoseBackend, TensorRTPoseBackend, load_pose_backend
+from .overlay import DepthColorizer, DisplayBuffer, OverlayRenderer
 
 __all__ = [
     "CaptureSession",
     "CaptureConfig",
+    "FrameGrabber",
     "PoseEstimator",
+    "MediaPipeBackend",
+    "OnnxPoseBackend",
+    "TensorRTPoseBackend",
+    "load_pose_backend",
     "OverlayRenderer",
+    "DepthColorizer",
+    "DisplayBuffer",
 ]
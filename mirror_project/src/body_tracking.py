@@ -1,18 +1,17 @@
 """Body tracking abstractions using MediaPipe as the default backend."""
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from typing import Iterable, Optional, Protocol, Sequence, Tuple
 
 import numpy as np
 import cv2
 
-try:
-    import mediapipe as mp
-except ImportError as exc:  # pragma: no cover - optional dependency
-    raise RuntimeError(
-        "mediapipe is required for body tracking. Install it with 'pip install mediapipe'."
-    ) from exc
+from .inference import LandmarkModelBackend
+from .temporal import MotionDetector, OneEuroFilter
+
+DEFAULT_ROI_REFRESH_INTERVAL = 15
 
 
 @dataclass
@@ -25,55 +24,420 @@ class PoseLandmark:
     visibility: float
 
 
+class LandmarkArray(Sequence[PoseLandmark]):
+    """Sequence view over an (N, 4) landmark array.
+
+    :class:`PoseLandmark` objects are only built when an element is accessed,
+    so consumers working on the raw array never pay for them.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: np.ndarray) -> None:
+        self._data = data
+
+    @property
+    def data(self) -> np.ndarray:
+        return self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        x, y, z, visibility = self._data[index].tolist()
+        return PoseLandmark(x=x, y=y, z=z, visibility=visibility)
+
+
 @dataclass
 class PoseResult:
-    """Bundle of detected pose landmarks for a single frame."""
+    """Bundle of detected pose landmarks for a single frame.
+
+    Landmarks are stored structure-of-arrays style in ``xyzv``, one contiguous
+    (N, 4) float32 array of normalized x, y, z and visibility, so NumPy
+    consumers (smoothing, ROI computation, overlay projection) use it as-is.
+    """
 
-    landmarks: List[PoseLandmark]
+    xyzv: np.ndarray
     image_height: int
     image_width: int
 
+    @classmethod
+    def from_landmarks(
+        cls, landmarks: Sequence[PoseLandmark], image_height: int, image_width: int
+    ) -> "PoseResult":
+        """Build a result from individual :class:`PoseLandmark` objects."""
+
+        xyzv = np.empty((len(landmarks), 4), dtype=np.float32)
+        for i, lm in enumerate(landmarks):
+            xyzv[i] = (lm.x, lm.y, lm.z, lm.visibility)
+        return cls(xyzv=xyzv, image_height=image_height, image_width=image_width)
+
+    @property
+    def landmarks(self) -> LandmarkArray:
+        """Lazy :class:`PoseLandmark` view over ``xyzv``."""
+
+        return LandmarkArray(self.xyzv)
+
     def as_ndarray(self) -> np.ndarray:
-        """Return landmarks as an array of shape (N, 4)."""
+        """Return landmarks as a float32 array of shape (N, 4)."""
+
+        return self.xyzv
 
-        return np.array([[lm.x, lm.y, lm.z, lm.visibility] for lm in self.landmarks])
+    def __eq__(self, other: object) -> bool:
+        # The generated __eq__ would compare the arrays element-wise.
+        if not isinstance(other, PoseResult):
+            return NotImplemented
+        return (
+            self.image_height == other.image_height
+            and self.image_width == other.image_width
+            and np.array_equal(self.xyzv, other.xyzv)
+        )
 
 
-class PoseEstimator:
-    """MediaPipe-based pose estimation wrapper."""
+class PoseBackend(Protocol):
+    """Inference runtime used by :class:`PoseEstimator`.
+
+    ``process`` receives an RGB uint8 image and returns (N, 4) landmarks
+    normalized to that image, or None when no pose is found. Backends that
+    can batch additionally expose ``max_batch`` and ``process_batch``.
+    """
+
+    def process(self, rgb: np.ndarray) -> Optional[np.ndarray]:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class MediaPipeBackend:
+    """Default backend running the MediaPipe Pose solution graph.
+
+    ``mediapipe`` (and the TensorFlow Lite runtime it loads) is only imported
+    here, so modules that never build this backend do not pay for it.
+    """
 
     def __init__(self, model_complexity: int = 1) -> None:
+        try:
+            import mediapipe as mp
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "mediapipe is required for body tracking. Install it with 'pip install mediapipe'."
+            ) from exc
+
         self._mp_pose = mp.solutions.pose.Pose(
             model_complexity=model_complexity,
             enable_segmentation=False,
         )
 
+    def process(self, rgb: np.ndarray) -> Optional[np.ndarray]:
+        results = self._mp_pose.process(rgb)
+        if not results.pose_landmarks:
+            return None
+        return _landmarks_to_array(results.pose_landmarks.landmark)
+
+    def close(self) -> None:  # pragma: no cover - resource cleanup
+        self._mp_pose.close()
+
+
+class PoseEstimator:
+    """Pose estimation wrapper, backed by MediaPipe unless told otherwise."""
+
+    def __init__(
+        self,
+        model_complexity: int = 1,
+        infer_size: Optional[Tuple[int, int]] = (384, 216),
+        roi_refresh_interval: Optional[int] = None,
+        roi_margin: float = 0.2,
+        min_roi_visibility: float = 0.5,
+        smoothing: bool = True,
+        motion_threshold: Optional[float] = 2.0,
+        max_skipped_frames: int = 5,
+        backend: Optional[PoseBackend] = None,
+        history_length: int = 12,
+    ) -> None:
+        """Create the estimator.
+
+        ``infer_size`` is the (width, height) pixel budget frames are
+        downscaled to before inference; MediaPipe resizes to its 256x256 model
+        input internally, so converting the full-resolution frame is wasted
+        work. Pass ``None`` to feed frames at their native resolution.
+
+        With a positive ``roi_refresh_interval``, a detection on the full
+        frame makes subsequent frames be cropped to the pose bounding box
+        (grown by ``roi_margin``) for up to that many frames. The crop is
+        dropped and the full frame processed again once the interval expires,
+        the mean landmark visibility falls below ``min_roi_visibility`` or the
+        pose leaves the crop. Pass 0 to always use the full frame. Left unset,
+        the interval is 15 for a stateless
+        :class:`~src.inference.LandmarkModelBackend` and 0 otherwise: MediaPipe
+        tracks the pose across frames on its own, and switching its input
+        between the frame and a crop interrupts that tracking.
+
+        With ``smoothing`` enabled, landmark positions are passed through a
+        1€ filter to remove frame-to-frame jitter. When the mean gray-level
+        change of a 64x64 thumbnail stays below ``motion_threshold``, the
+        previous result is returned without running inference, for at most
+        ``max_skipped_frames`` consecutive frames. Pass
+        ``motion_threshold=None`` to run inference on every frame.
+
+        ``backend`` replaces the default :class:`MediaPipeBackend`, e.g. with
+        an :class:`~src.inference.OnnxPoseBackend`; ``model_complexity`` only
+        applies to the default.
+
+        The last ``history_length`` detected poses are kept in a (T, N, 4)
+        ring buffer for temporal consumers; see :attr:`history` and
+        :meth:`recent_window`. The ring is sized from the first pose and
+        cleared if a later pose has a different landmark count N.
+        """
+
+        self._backend = backend or MediaPipeBackend(model_complexity)
+        self._infer_size = infer_size
+        self._small: Optional[np.ndarray] = None
+        self._rgb: Optional[np.ndarray] = None
+        if roi_refresh_interval is None:
+            stateless = isinstance(self._backend, LandmarkModelBackend)
+            roi_refresh_interval = DEFAULT_ROI_REFRESH_INTERVAL if stateless else 0
+        self._roi_refresh_interval = roi_refresh_interval or None
+        self._roi_margin = roi_margin
+        self._min_roi_visibility = min_roi_visibility
+        self._roi: Optional[Tuple[int, int, int, int]] = None
+        self._roi_age = 0
+        self._filter = OneEuroFilter() if smoothing else None
+        self._motion = MotionDetector() if motion_threshold is not None else None
+        self._motion_threshold = motion_threshold
+        self._max_skipped_frames = max_skipped_frames
+        self._skipped = 0
+        self._last: Optional[PoseResult] = None
+        self._has_last = False
+        self._history = np.zeros((history_length, 0, 4), dtype=np.float32)
+        self._history_index = 0
+        self._history_count = 0
+
     def estimate(self, frame: np.ndarray) -> Optional[PoseResult]:
         """Run pose estimation on a BGR frame."""
 
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self._mp_pose.process(rgb_frame)
-        if not results.pose_landmarks:
-            return None
-        landmarks = [
-            PoseLandmark(
-                x=lm.x,
-                y=lm.y,
-                z=lm.z,
-                visibility=lm.visibility,
-            )
-            for lm in results.pose_landmarks.landmark
-        ]
-        height, width, _ = frame.shape
-        return PoseResult(landmarks=landmarks, image_height=height, image_width=width)
+        if self._motion is not None:
+            still = self._motion.measure(frame) < self._motion_threshold
+            if still and self._has_last and self._skipped < self._max_skipped_frames:
+                self._skipped += 1
+                return self._last
+            self._motion.commit()
+        self._skipped = 0
+
+        self._last = self._estimate(frame)
+        self._has_last = True
+        return self._last
 
     def batch_estimate(
         self, frames: Iterable[np.ndarray]
     ) -> Iterable[Optional[PoseResult]]:
-        """Stream pose results for an iterable of frames."""
+        """Stream pose results for an iterable of frames.
 
+        With a batching backend, frames are grouped into batches of up to
+        ``max_batch`` and inferred in one call each. Frames in a batch carry
+        no timing, so they are processed at full frame without ROI cropping,
+        motion skipping or smoothing, and they leave the streaming state used
+        by :meth:`estimate` (filter, ROI and :attr:`history`) untouched.
+        """
+
+        max_batch = getattr(self._backend, "max_batch", 1)
+        if max_batch <= 1:
+            for frame in frames:
+                yield self.estimate(frame)
+            return
+
+        batch = []
         for frame in frames:
-            yield self.estimate(frame)
+            batch.append(frame)
+            if len(batch) == max_batch:
+                yield from self._estimate_batch(batch)
+                batch = []
+        if batch:
+            yield from self._estimate_batch(batch)
+
+    @property
+    def history(self) -> Tuple[np.ndarray, int]:
+        """Return the landmark ring buffer and the slot the next pose goes to.
+
+        The ring is updated in place; consumers that can index it modulo its
+        length avoid the copy made by :meth:`recent_window`.
+        """
+
+        return self._history, self._history_index
+
+    def recent_window(self) -> np.ndarray:
+        """Return the stored poses oldest first, as a (count, N, 4) array copy.
+
+        ``count`` grows with each detection until it reaches the history length.
+        """
+
+        if self._history_count < len(self._history):
+            return self._history[: self._history_count].copy()
+        index = self._history_index
+        return np.concatenate((self._history[index:], self._history[:index]))
 
     def close(self) -> None:  # pragma: no cover - resource cleanup
-        self._mp_pose.close()
+        self._backend.close()
+
+    def _estimate_batch(self, frames: Sequence[np.ndarray]) -> Iterable[Optional[PoseResult]]:
+        batch_points = self._backend.process_batch(self._to_rgb(frame) for frame in frames)
+        for frame, points in zip(frames, batch_points):
+            height, width, _ = frame.shape
+            yield self._finalize(points, height, width, streaming=False)
+
+    def _estimate(self, frame: np.ndarray) -> Optional[PoseResult]:
+        height, width, _ = frame.shape
+        roi = self._roi
+        points = self._infer(frame, roi)
+        if points is None and roi is not None:
+            # The subject left the cached crop; fall back to the full frame.
+            roi = None
+            points = self._infer(frame, roi)
+        self._update_roi(points, roi, width, height)
+        return self._finalize(points, height, width, streaming=True)
+
+    def _finalize(
+        self,
+        points: Optional[np.ndarray],
+        height: int,
+        width: int,
+        streaming: bool,
+    ) -> Optional[PoseResult]:
+        """Wrap full-frame landmarks in a :class:`PoseResult`.
+
+        Only ``streaming`` results, from consecutive :meth:`estimate` calls,
+        are smoothed and recorded in the history ring.
+        """
+
+        if points is None:
+            if streaming and self._filter is not None:
+                self._filter.reset()
+            return None
+        if streaming:
+            if self._filter is not None:
+                points[:, :3] = self._filter(points[:, :3], time.perf_counter())
+            self._record(points)
+        return PoseResult(xyzv=points, image_height=height, image_width=width)
+
+    def _record(self, points: np.ndarray) -> None:
+        """Write a detected pose into the next history slot."""
+
+        history_length = len(self._history)
+        if history_length == 0:
+            return
+        if self._history.shape[1] != len(points):
+            self._history = np.zeros((history_length, len(points), 4), dtype=np.float32)
+            self._history_index = 0
+            self._history_count = 0
+        self._history[self._history_index] = points
+        self._history_index = (self._history_index + 1) % history_length
+        self._history_count = min(self._history_count + 1, history_length)
+
+    def _infer(
+        self, frame: np.ndarray, roi: Optional[Tuple[int, int, int, int]]
+    ) -> Optional[np.ndarray]:
+        """Run the backend on ``frame`` or its ``roi`` crop.
+
+        Returned landmarks are normalized to the full frame either way.
+        """
+
+        if roi is None:
+            view = frame
+        else:
+            x0, y0, x1, y1 = roi
+            view = frame[y0:y1, x0:x1]
+        points = self._backend.process(self._to_rgb(view))
+        if points is None:
+            return None
+        if roi is not None:
+            height, width = frame.shape[:2]
+            scale_x = (x1 - x0) / width
+            points[:, 0] *= scale_x
+            points[:, 0] += x0 / width
+            points[:, 1] *= (y1 - y0) / height
+            points[:, 1] += y0 / height
+            # MediaPipe scales depth like x, relative to the input width.
+            points[:, 2] *= scale_x
+        return points
+
+    def _update_roi(
+        self,
+        points: Optional[np.ndarray],
+        used_roi: Optional[Tuple[int, int, int, int]],
+        width: int,
+        height: int,
+    ) -> None:
+        """Cache a crop after a full-frame detection, or invalidate the current one."""
+
+        if self._roi_refresh_interval is None or points is None:
+            self._roi = None
+            return
+        visible = points[:, 3] >= self._min_roi_visibility
+        if points[:, 3].mean() < self._min_roi_visibility or not visible.any():
+            self._roi = None
+            return
+        x_min, y_min = points[visible, :2].min(axis=0)
+        x_max, y_max = points[visible, :2].max(axis=0)
+        if used_roi is None:
+            margin_x = (x_max - x_min) * self._roi_margin
+            margin_y = (y_max - y_min) * self._roi_margin
+            x0 = max(0, int((x_min - margin_x) * width))
+            y0 = max(0, int((y_min - margin_y) * height))
+            x1 = min(width, int(np.ceil((x_max + margin_x) * width)))
+            y1 = min(height, int(np.ceil((y_max + margin_y) * height)))
+            self._roi = (x0, y0, x1, y1) if x1 - x0 >= 32 and y1 - y0 >= 32 else None
+            self._roi_age = 0
+            return
+        self._roi_age += 1
+        x0, y0, x1, y1 = used_roi
+        inside = (
+            x_min * width >= x0
+            and y_min * height >= y0
+            and x_max * width <= x1
+            and y_max * height <= y1
+        )
+        if not inside or self._roi_age >= self._roi_refresh_interval:
+            self._roi = None
+
+    def _to_rgb(self, image: np.ndarray) -> np.ndarray:
+        """Downscale ``image`` to the inference budget and convert it to RGB.
+
+        The capture path delivers BGR for display and recording, so both steps
+        write into reused buffers rather than allocating a new frame each call.
+        """
+
+        height, width = image.shape[:2]
+        if self._infer_size is not None:
+            infer_w, infer_h = self._infer_size
+            scale = min(1.0, np.sqrt((infer_w * infer_h) / (width * height)))
+            if scale < 1.0:
+                size = (max(1, round(width * scale)), max(1, round(height * scale)))
+                self._small = _reuse_buffer(self._small, (size[1], size[0], 3), image.dtype)
+                cv2.resize(image, size, dst=self._small, interpolation=cv2.INTER_LINEAR)
+                image = self._small
+        self._rgb = _reuse_buffer(self._rgb, image.shape, image.dtype)
+        cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        return self._rgb
+
+
+def _landmarks_to_array(landmarks) -> np.ndarray:
+    """Copy a MediaPipe landmark list straight into an (N, 4) float32 array."""
+
+    points = np.empty((len(landmarks), 4), dtype=np.float32)
+    for i, lm in enumerate(landmarks):
+        row = points[i]
+        row[0] = lm.x
+        row[1] = lm.y
+        row[2] = lm.z
+        row[3] = lm.visibility
+    return points
+
+
+def _reuse_buffer(buffer: Optional[np.ndarray], shape, dtype) -> np.ndarray:
+    """Return ``buffer`` if it matches ``shape``/``dtype``, else a new one."""
+
+    if buffer is None or buffer.shape != tuple(shape) or buffer.dtype != dtype:
+        return np.empty(shape, dtype=dtype)
+    return buffer
@@ -1,22 +1,29 @@
 """Capture utilities for live RealSense streaming and recorded playback."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Optional
-
-try:
-    import pyrealsense2 as rs
-except ImportError as exc:  # pragma: no cover - hardware dependent
-    raise RuntimeError(
-        "pyrealsense2 is required for capture operations. "
-        "Install the RealSense SDK and Python bindings before using this module."
-    ) from exc
+from typing import Deque, Iterable, List, Optional, Tuple
 
 import cv2
 import numpy as np
 
 
+def _import_realsense():
+    """Import pyrealsense2 on first use so importing this module stays cheap."""
+
+    try:
+        import pyrealsense2 as rs
+    except ImportError as exc:  # pragma: no cover - hardware dependent
+        raise RuntimeError(
+            "pyrealsense2 is required for capture operations. "
+            "Install the RealSense SDK and Python bindings before using this module."
+        ) from exc
+    return rs
+
+
 @dataclass
 class StreamProfile:
     """Stream resolution and framerate configuration."""
@@ -30,8 +37,8 @@ class StreamProfile:
 class CaptureConfig:
     """Configuration for RealSense capture sessions."""
 
-    color_stream: StreamProfile = StreamProfile()
-    depth_stream: StreamProfile = StreamProfile()
+    color_stream: StreamProfile = field(default_factory=StreamProfile)
+    depth_stream: StreamProfile = field(default_factory=StreamProfile)
     align_to_color: bool = True
     playback_file: Optional[Path] = None
 
@@ -41,9 +48,21 @@ class CaptureSession:
 
     def __init__(self, config: CaptureConfig) -> None:
         self._config = config
+        self._rs = rs = _import_realsense()
         self._pipeline = rs.pipeline()
+        # librealsense built with BUILD_WITH_CUDA runs this alignment on the GPU.
         self._align = rs.align(rs.stream.color) if config.align_to_color else None
         self._started = False
+        color_shape = (config.color_stream.height, config.color_stream.width)
+        depth_shape = color_shape if config.align_to_color else (
+            config.depth_stream.height,
+            config.depth_stream.width,
+        )
+        self._buffers = [
+            (np.empty((*color_shape, 3), dtype=np.uint8), np.empty(depth_shape, dtype=np.uint16))
+            for _ in range(2)
+        ]
+        self._buffer_index = 0
 
     def __enter__(self) -> "CaptureSession":
         self.start()
@@ -55,6 +74,7 @@ class CaptureSession:
     def start(self) -> None:
         if self._started:
             return
+        rs = self._rs
         cfg = rs.config()
         cfg.enable_stream(
             rs.stream.color,
@@ -81,23 +101,57 @@ class CaptureSession:
         self._pipeline.stop()
         self._started = False
 
-    def frames(self) -> Iterable[tuple[np.ndarray, np.ndarray]]:
-        """Yield synchronized color and depth frames as NumPy arrays."""
+    def read(
+        self, timeout_ms: Optional[int] = None, copy: bool = True
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Fetch the next synchronized color and depth pair.
+
+        Blocks until a frameset arrives when ``timeout_ms`` is None. Otherwise
+        waits at most ``timeout_ms`` via ``try_wait_for_frames`` and returns
+        None if nothing arrived in time, which lets a polling caller do other
+        work (or notice it should stop) instead of blocking in the SDK.
+        ``copy`` behaves as for :meth:`frames`.
+        """
 
         if not self._started:
             raise RuntimeError("CaptureSession must be started before requesting frames")
 
-        while True:
+        if timeout_ms is None:
             frames = self._pipeline.wait_for_frames()
-            if self._align is not None:
-                frames = self._align.process(frames)
-            color_frame = frames.get_color_frame()
-            depth_frame = frames.get_depth_frame()
-            if not color_frame or not depth_frame:  # pragma: no cover - defensive
-                continue
-            color = np.asanyarray(color_frame.get_data())
-            depth = np.asanyarray(depth_frame.get_data())
-            yield color, depth
+        else:
+            got_frames, frames = self._pipeline.try_wait_for_frames(timeout_ms)
+            if not got_frames:
+                return None
+        if self._align is not None:
+            frames = self._align.process(frames)
+        color_frame = frames.get_color_frame()
+        depth_frame = frames.get_depth_frame()
+        if not color_frame or not depth_frame:  # pragma: no cover - defensive
+            return None
+        color = np.asanyarray(color_frame.get_data())
+        depth = np.asanyarray(depth_frame.get_data())
+        if copy:
+            color_buffer, depth_buffer = self._buffers[self._buffer_index]
+            self._buffer_index ^= 1
+            np.copyto(color_buffer, color)
+            np.copyto(depth_buffer, depth)
+            color, depth = color_buffer, depth_buffer
+        return color, depth
+
+    def frames(self, copy: bool = True) -> Iterable[tuple[np.ndarray, np.ndarray]]:
+        """Yield synchronized color and depth frames as NumPy arrays.
+
+        By default each pair is copied into one of two reused host buffers
+        (ping-pong), so downstream code always sees the same aligned arrays
+        and a yielded pair stays valid until the next-but-one pair is
+        produced. Pass ``copy=False`` to receive arrays that wrap the
+        librealsense frame memory directly.
+        """
+
+        while True:
+            pair = self.read(copy=copy)
+            if pair is not None:
+                yield pair
 
     def show_preview(self) -> None:  # pragma: no cover - requires GUI
         """Preview the stream in a window until ESC is pressed."""
@@ -114,6 +168,109 @@ class CaptureSession:
         cv2.destroyAllWindows()
 
 
+class FrameGrabber:
+    """Background producer that always holds the freshest color/depth pair.
+
+    A daemon thread polls :meth:`CaptureSession.read` into a small LIFO
+    buffer, so the RealSense pipeline never waits for a slow consumer. The
+    consumer pops the newest pair and older, unprocessed pairs are dropped.
+    Polling with a short ``poll_timeout_ms`` keeps the thread from sitting in
+    a blocking SDK call, so it yields regularly and stops promptly.
+
+    Frames are copied into a pool of reused host buffers; a buffer only
+    returns to the pool once it is dropped or the consumer asks for the next
+    pair, so the pair returned by :meth:`latest` stays valid until then.
+    """
+
+    def __init__(
+        self, session: CaptureSession, maxlen: int = 2, poll_timeout_ms: int = 5
+    ) -> None:
+        self._session = session
+        self._poll_timeout_ms = poll_timeout_ms
+        self._buffer: Deque[Tuple[np.ndarray, np.ndarray]] = deque(maxlen=maxlen)
+        self._free: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._held: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._lock = threading.Lock()
+        self._available = threading.Event()
+        self._stopped = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "FrameGrabber":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - resource cleanup
+        self.stop()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="capture-producer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._available.set()
+        self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def latest(self, timeout: Optional[float] = None) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Pop the newest pair, discarding older ones. Returns None on timeout."""
+
+        if not self._available.wait(timeout):
+            return None
+        with self._lock:
+            if self._error is not None:
+                raise RuntimeError("Capture thread terminated unexpectedly") from self._error
+            self._available.clear()
+            if not self._buffer:
+                return None
+            pair = self._buffer.pop()
+            self._free.extend(self._buffer)
+            self._buffer.clear()
+            if self._held is not None:
+                self._free.append(self._held)
+            self._held = pair
+        return pair
+
+    def frames(self) -> Iterable[tuple[np.ndarray, np.ndarray]]:
+        """Yield the freshest available pair until the grabber is stopped."""
+
+        while not self._stopped.is_set():
+            pair = self.latest(timeout=1.0)
+            if pair is not None:
+                yield pair
+
+    def _run(self) -> None:
+        try:
+            while not self._stopped.is_set():
+                pair = self._session.read(timeout_ms=self._poll_timeout_ms, copy=False)
+                if pair is None:
+                    continue
+                color, depth = pair
+                with self._lock:
+                    slot = self._free.pop() if self._free else None
+                if slot is None:
+                    # At most maxlen + 2 slots exist: queued, held and being written.
+                    slot = (np.empty_like(color), np.empty_like(depth))
+                np.copyto(slot[0], color)
+                np.copyto(slot[1], depth)
+                with self._lock:
+                    if len(self._buffer) == self._buffer.maxlen:
+                        self._free.append(self._buffer.popleft())
+                    self._buffer.append(slot)
+                    self._available.set()
+        except Exception as exc:
+            with self._lock:
+                if not self._stopped.is_set():
+                    self._error = exc
+            self._available.set()
+
+
 def playback(file_path: Path) -> CaptureSession:
     """Convenience helper to build a playback session from a .bag recording."""
 
@@ -0,0 +1,295 @@
+"""Accelerated runtimes for exported BlazePose landmark models."""
+from __future__ import annotations
+
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+DEFAULT_ONNX_PROVIDERS = (
+    "TensorrtExecutionProvider",
+    "CUDAExecutionProvider",
+    "CPUExecutionProvider",
+)
+NUM_LANDMARKS = 33
+
+
+class LandmarkModelBackend(ABC):
+    """Letterbox pre- and post-processing shared by the landmark model runtimes.
+
+    The model is expected to take a square RGB float tensor in ``[0, 1]`` and
+    produce flattened landmarks (x, y, z, visibility, presence per point, in
+    input pixels) plus a pose presence score, like MediaPipe's
+    ``pose_landmark_*.tflite``. Subclasses only implement :meth:`_run`.
+
+    Models exported with a dynamic batch axis can run up to ``max_batch``
+    images in one call through :meth:`process_batch`.
+    """
+
+    def __init__(
+        self,
+        input_size: int = 256,
+        channels_first: bool = False,
+        presence_threshold: float = 0.5,
+        max_batch: int = 1,
+    ) -> None:
+        self._input_size = input_size
+        self._channels_first = channels_first
+        self._presence_threshold = presence_threshold
+        self._canvas = np.zeros((input_size, input_size, 3), dtype=np.uint8)
+        self._layout: Optional[Tuple[int, int, int, int]] = None
+        shape = (3, input_size, input_size) if channels_first else (input_size, input_size, 3)
+        self._tensor = np.empty((max_batch, *shape), dtype=np.float32)
+        self.max_batch = max_batch
+
+    def process(self, rgb: np.ndarray) -> Optional[np.ndarray]:
+        """Return (33, 4) landmarks normalized to ``rgb``, or None if no pose."""
+
+        layout = self._preprocess(rgb, self._tensor[0])
+        landmarks, presence = self._run(self._tensor[:1])
+        return self._postprocess(landmarks[0], float(presence[0, 0]), layout)
+
+    def process_batch(self, images: Iterable[np.ndarray]) -> List[Optional[np.ndarray]]:
+        """Run up to ``max_batch`` RGB images through a single inference call.
+
+        Images are consumed one at a time and letterboxed into the batch
+        tensor immediately, so successive images may share one buffer.
+        """
+
+        layouts = []
+        for slot, rgb in enumerate(images):
+            if slot >= self.max_batch:
+                raise ValueError(f"Batch exceeds max_batch={self.max_batch}")
+            layouts.append(self._preprocess(rgb, self._tensor[slot]))
+        if not layouts:
+            return []
+        landmarks, presence = self._run(self._tensor[: len(layouts)])
+        return [
+            self._postprocess(landmarks[i], float(presence[i, 0]), layout)
+            for i, layout in enumerate(layouts)
+        ]
+
+    def close(self) -> None:  # pragma: no cover - resource cleanup
+        pass
+
+    @abstractmethod
+    def _run(self, tensor: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Infer a (B, H, W, C) or (B, C, H, W) batch into (landmarks, presence)."""
+
+    def _preprocess(self, rgb: np.ndarray, out: np.ndarray) -> Tuple[int, int, int, int]:
+        """Letterbox ``rgb`` into the square model input and write it to ``out``.
+
+        Returns the placement ``(new_w, new_h, pad_x, pad_y)`` within the input.
+        """
+
+        height, width = rgb.shape[:2]
+        size = self._input_size
+        scale = size / max(height, width)
+        new_w, new_h = max(1, round(width * scale)), max(1, round(height * scale))
+        pad_x, pad_y = (size - new_w) // 2, (size - new_h) // 2
+        layout = (new_w, new_h, pad_x, pad_y)
+        if layout != self._layout:
+            self._canvas.fill(0)
+            self._layout = layout
+        cv2.resize(
+            rgb,
+            (new_w, new_h),
+            dst=self._canvas[pad_y:pad_y + new_h, pad_x:pad_x + new_w],
+            interpolation=cv2.INTER_LINEAR,
+        )
+        target = out.transpose(1, 2, 0) if self._channels_first else out
+        np.multiply(self._canvas, np.float32(1.0 / 255.0), out=target, dtype=np.float32)
+        return layout
+
+    def _postprocess(
+        self, landmarks: np.ndarray, presence: float, layout: Tuple[int, int, int, int]
+    ) -> Optional[np.ndarray]:
+        if presence < self._presence_threshold:
+            return None
+        new_w, new_h, pad_x, pad_y = layout
+        raw = landmarks.reshape(-1, 5)[:NUM_LANDMARKS]
+        points = np.empty((len(raw), 4), dtype=np.float32)
+        points[:, 0] = (raw[:, 0] - pad_x) / new_w
+        points[:, 1] = (raw[:, 1] - pad_y) / new_h
+        points[:, 2] = raw[:, 2] / new_w
+        # Visibility is emitted as a logit, as in MediaPipe's landmark decoder.
+        points[:, 3] = 1.0 / (1.0 + np.exp(-raw[:, 3]))
+        return points
+
+
+class OnnxPoseBackend(LandmarkModelBackend):
+    """Run an ONNX export of the pose landmark model through ONNX Runtime.
+
+    The session uses every CPU core for intra-op parallelism and full graph
+    optimization. Execution providers are tried in order of ``providers``,
+    keeping only those the installed ``onnxruntime`` build offers, so the same
+    code picks TensorRT or CUDA on a Jetson and plain CPU elsewhere.
+
+    A fixed batch axis in the export sets ``max_batch``; smaller batches are
+    zero-padded up to it, since the session rejects any other batch size.
+    """
+
+    def __init__(
+        self,
+        model_path: Path,
+        providers: Sequence[str] = DEFAULT_ONNX_PROVIDERS,
+        num_threads: Optional[int] = None,
+        presence_threshold: float = 0.5,
+        max_batch: int = 4,
+    ) -> None:
+        try:
+            import onnxruntime as ort
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "onnxruntime is required for the ONNX pose backend. "
+                "Install it with 'pip install onnxruntime' (or onnxruntime-gpu)."
+            ) from exc
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = num_threads or os.cpu_count() or 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        available = set(ort.get_available_providers())
+        self._session = ort.InferenceSession(
+            str(model_path),
+            sess_options=options,
+            providers=[p for p in providers if p in available],
+        )
+
+        model_input = self._session.get_inputs()[0]
+        self._input_name = model_input.name
+        shape = model_input.shape
+        channels_first = shape[1] == 3
+        input_size = shape[2] if channels_first else shape[1]
+        self._output_names = [output.name for output in self._session.get_outputs()[:2]]
+        self._fixed_batch = shape[0] if isinstance(shape[0], int) else None
+        super().__init__(
+            input_size=input_size if isinstance(input_size, int) else 256,
+            channels_first=channels_first,
+            presence_threshold=presence_threshold,
+            max_batch=self._fixed_batch or max_batch,
+        )
+
+    def _run(self, tensor: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        batch = len(tensor)
+        if self._fixed_batch is not None and batch < self._fixed_batch:
+            # An export with a fixed batch axis only accepts full batches, so
+            # zero the unused rows of the input tensor and drop their outputs.
+            self._tensor[batch:] = 0.0
+            tensor = self._tensor
+        landmarks, presence = self._session.run(self._output_names, {self._input_name: tensor})
+        return (
+            landmarks.reshape(len(tensor), -1)[:batch],
+            presence.reshape(len(tensor), -1)[:batch],
+        )
+
+
+class TensorRTPoseBackend(LandmarkModelBackend):
+    """Run a serialized TensorRT engine of the landmark model on the GPU.
+
+    Intended for FP16 or INT8 engines built with ``trtexec`` on the Jetson
+    itself (engines are not portable across TensorRT versions or devices).
+    The input tensor lives in pinned host memory so the upload is a plain DMA.
+    Engines built with a dynamic batch profile (``--minShapes``/``--maxShapes``)
+    accept batches up to the profile maximum, capped at ``max_batch``.
+    """
+
+    def __init__(
+        self, engine_path: Path, presence_threshold: float = 0.5, max_batch: int = 4
+    ) -> None:
+        try:
+            import tensorrt as trt
+            import pycuda.autoinit  # noqa: F401 - creates the CUDA context
+            import pycuda.driver as cuda
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "tensorrt and pycuda are required for the TensorRT pose backend. "
+                "TensorRT ships with JetPack; install pycuda with 'pip install pycuda'."
+            ) from exc
+
+        self._cuda = cuda
+        logger = trt.Logger(trt.Logger.WARNING)
+        with open(engine_path, "rb") as handle, trt.Runtime(logger) as runtime:
+            self._engine = runtime.deserialize_cuda_engine(handle.read())
+        if self._engine is None:
+            raise RuntimeError(f"Failed to deserialize TensorRT engine {engine_path}")
+        self._context = self._engine.create_execution_context()
+        self._stream = cuda.Stream()
+
+        names = [self._engine.get_tensor_name(i) for i in range(self._engine.num_io_tensors)]
+        inputs = [n for n in names if self._engine.get_tensor_mode(n) == trt.TensorIOMode.INPUT]
+        outputs = [n for n in names if self._engine.get_tensor_mode(n) == trt.TensorIOMode.OUTPUT]
+        self._input_name = inputs[0]
+        shape = tuple(self._engine.get_tensor_shape(self._input_name))
+        channels_first = shape[1] == 3
+        self._dynamic_batch = shape[0] == -1
+        if self._dynamic_batch:
+            profile_max = self._engine.get_tensor_profile_shape(self._input_name, 0)[2]
+            max_batch = min(max_batch, profile_max[0])
+        else:
+            max_batch = shape[0]
+        super().__init__(
+            input_size=shape[2] if channels_first else shape[1],
+            channels_first=channels_first,
+            presence_threshold=presence_threshold,
+            max_batch=max_batch,
+        )
+        if self._dynamic_batch:
+            # Size every buffer for the largest batch; smaller batches use a prefix.
+            self._context.set_input_shape(self._input_name, self._tensor.shape)
+        self._batch = len(self._tensor)
+
+        # Every I/O tensor needs a device address, but only the landmark and
+        # presence outputs (the first two) are copied back to the host.
+        self._host = {}
+        self._device = {}
+        for name in (self._input_name, *outputs):
+            dtype = trt.nptype(self._engine.get_tensor_dtype(name))
+            host = cuda.pagelocked_empty(tuple(self._context.get_tensor_shape(name)), dtype)
+            self._host[name] = host
+            self._device[name] = cuda.mem_alloc(host.nbytes)
+            self._context.set_tensor_address(name, int(self._device[name]))
+        self._output_names = outputs[:2]
+        if self._host[self._input_name].dtype == np.float32:
+            # Preprocess straight into pinned memory.
+            self._tensor = self._host[self._input_name]
+
+    def close(self) -> None:  # pragma: no cover - resource cleanup
+        for device in self._device.values():
+            device.free()
+        self._device.clear()
+
+    def _run(self, tensor: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        cuda = self._cuda
+        batch = len(tensor)
+        if self._dynamic_batch and batch != self._batch:
+            self._context.set_input_shape(self._input_name, tensor.shape)
+            self._batch = batch
+        host_input = self._host[self._input_name][:batch]
+        if not np.shares_memory(tensor, host_input):
+            np.copyto(host_input, tensor, casting="same_kind")
+        cuda.memcpy_htod_async(self._device[self._input_name], host_input, self._stream)
+        self._context.execute_async_v3(stream_handle=self._stream.handle)
+        outputs = [self._host[name][:batch] for name in self._output_names]
+        for name, host in zip(self._output_names, outputs):
+            cuda.memcpy_dtoh_async(host, self._device[name], self._stream)
+        self._stream.synchronize()
+        landmarks, presence = outputs
+        return (
+            landmarks.reshape(batch, -1).astype(np.float32, copy=False),
+            presence.reshape(batch, -1).astype(np.float32, copy=False),
+        )
+
+
+def load_pose_backend(model_path: Path) -> LandmarkModelBackend:
+    """Pick the runtime for an exported landmark model by file extension.
+
+    ``.plan``/``.engine`` files are loaded with TensorRT, anything else is
+    treated as an ONNX model.
+    """
+
+    if model_path.suffix in (".plan", ".engine"):
+        return TensorRTPoseBackend(model_path)
+    return OnnxPoseBackend(model_path)
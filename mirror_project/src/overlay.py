@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Tuple
+from typing import Iterable, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -22,20 +22,39 @@ class OverlayRenderer:
     def __init__(self, colors: OverlayColors | None = None) -> None:
         self._colors = colors or OverlayColors()
         self._pairs = self._default_pairs()
+        self._pair_idx = np.array(self._pairs, dtype=np.intp)
+        self._scale = np.empty(2, dtype=np.float32)
+        self._project_jit = _compiled_kernels()[0]
+        self._allocate_coords(33)
 
-    def render(self, frame: np.ndarray, pose: PoseResult) -> np.ndarray:
-        """Return frame annotated with pose skeleton."""
+    def render(
+        self, frame: np.ndarray | cv2.UMat, pose: PoseResult, in_place: bool = True
+    ) -> np.ndarray | cv2.UMat:
+        """Return frame annotated with pose skeleton.
 
-        height, width = pose.image_height, pose.image_width
-        points = pose.as_ndarray()
-        coords = np.column_stack((points[:, 0] * width, points[:, 1] * height)).astype(int)
+        By default the skeleton is drawn directly onto ``frame``; pass
+        ``in_place=False`` to draw on a copy and leave the input untouched.
+        ``frame`` may be a ``cv2.UMat`` to draw through OpenCV's OpenCL path.
+        """
 
-        annotated = frame.copy()
-        for start, end in self._pairs:
-            if start >= len(coords) or end >= len(coords):  # pragma: no cover - safety
-                continue
-            cv2.line(annotated, tuple(coords[start]), tuple(coords[end]), self._colors.skeleton, 2)
-        for x, y in coords:
+        coords, segments = self._project(pose)
+        if in_place:
+            annotated = frame
+        elif isinstance(frame, cv2.UMat):
+            annotated = cv2.UMat(frame.get())
+        else:
+            annotated = frame.copy()
+
+        if isinstance(annotated, cv2.UMat):
+            # The bindings reject point arrays for polylines on a UMat image.
+            for start, end in segments.tolist():
+                cv2.line(annotated, tuple(start), tuple(end), self._colors.skeleton, 2)
+        else:
+            # Each (2, 2) segment is an open two-point polyline: one call draws all bones.
+            cv2.polylines(
+                annotated, segments, isClosed=False, color=self._colors.skeleton, thickness=2
+            )
+        for x, y in coords.tolist():
             cv2.circle(annotated, (x, y), 4, self._colors.joints, -1)
         return annotated
 
@@ -50,6 +69,41 @@ class OverlayRenderer:
             else:
                 yield self.render(frame, pose)
 
+    def _allocate_coords(self, count: int) -> None:
+        self._coords_f = np.empty((count, 2), dtype=np.float32)
+        self._coords = np.empty((count, 2), dtype=np.int32)
+        # Drop bones whose joints the model does not provide.
+        self._active_pairs = self._pair_idx[(self._pair_idx < count).all(axis=1)]
+        self._segments = np.empty((len(self._active_pairs), 2, 2), dtype=np.int32)
+
+    def _project(self, pose: PoseResult) -> Tuple[np.ndarray, np.ndarray]:
+        """Scale landmarks to pixel coordinates and gather bone segments.
+
+        Both results live in reused buffers. With numba installed, scaling,
+        rounding and the segment gather run as one compiled loop.
+        """
+
+        points = pose.xyzv
+        if len(points) != len(self._coords):
+            self._allocate_coords(len(points))
+        if self._project_jit is not None:
+            self._project_jit(
+                points,
+                self._active_pairs,
+                pose.image_width,
+                pose.image_height,
+                self._coords,
+                self._segments,
+            )
+            return self._coords, self._segments
+        self._scale[0] = pose.image_width
+        self._scale[1] = pose.image_height
+        np.multiply(points[:, :2], self._scale, out=self._coords_f)
+        np.rint(self._coords_f, out=self._coords_f)
+        self._coords[:] = self._coords_f
+        np.take(self._coords, self._active_pairs, axis=0, out=self._segments)
+        return self._coords, self._segments
+
     @staticmethod
     def _default_pairs() -> Tuple[Tuple[int, int], ...]:
         # Simplified skeleton connection map
@@ -66,3 +120,124 @@ class OverlayRenderer:
             (24, 26),  # right thigh
             (26, 28),  # right calf
         )
+
+
+def _project_and_segment(points, pair_idx, width, height, coords, segments):
+    """Fill ``coords`` with rounded pixel positions and ``segments`` with bone endpoints."""
+
+    for i in range(points.shape[0]):
+        coords[i, 0] = np.int32(np.rint(points[i, 0] * width))
+        coords[i, 1] = np.int32(np.rint(points[i, 1] * height))
+    for k in range(pair_idx.shape[0]):
+        start = pair_idx[k, 0]
+        end = pair_idx[k, 1]
+        segments[k, 0, 0] = coords[start, 0]
+        segments[k, 0, 1] = coords[start, 1]
+        segments[k, 1, 0] = coords[end, 0]
+        segments[k, 1, 1] = coords[end, 1]
+
+
+def _gather_lut(lut, depth, out):
+    """Write ``lut[depth]`` into ``out`` in one pass over the depth image."""
+
+    for row in range(depth.shape[0]):
+        for col in range(depth.shape[1]):
+            value = depth[row, col]
+            out[row, col, 0] = lut[value, 0]
+            out[row, col, 1] = lut[value, 1]
+            out[row, col, 2] = lut[value, 2]
+
+
+_KERNELS = None
+
+
+def _compiled_kernels():
+    """Return the numba-compiled ``(_project_and_segment, _gather_lut)`` pair.
+
+    numba is optional and takes a noticeable time to import, so it is loaded
+    on first use; both entries are None when it is not installed.
+    """
+
+    global _KERNELS
+    if _KERNELS is None:
+        try:
+            from numba import njit
+        except ImportError:  # pragma: no cover - optional dependency
+            _KERNELS = (None, None)
+        else:
+            _KERNELS = (njit(cache=True)(_project_and_segment), njit(cache=True)(_gather_lut))
+    return _KERNELS
+
+
+class DepthColorizer:
+    """Render 16-bit depth frames as JET colormaps for preview windows.
+
+    With numba installed, the scale and colormap are folded into one
+    precomputed 65536-entry lookup table (192KB, stays in L2) and colorizing
+    is a single compiled gather. Otherwise OpenCV's two SIMD passes are used,
+    which beat a NumPy gather. Either way the CPU result is written into a
+    buffer reused across calls, so it is overwritten by the next call. With
+    ``use_opencl`` the conversion runs on OpenCV's OpenCL device through
+    ``cv2.UMat`` and a ``UMat`` is returned, which ``cv2.imshow`` accepts.
+    """
+
+    def __init__(self, alpha: float = 0.03, use_opencl: bool = False) -> None:
+        self._alpha = alpha
+        self._use_opencl = use_opencl
+        self._scaled: Optional[np.ndarray] = None
+        self._colormap: Optional[np.ndarray] = None
+        self._lut: Optional[np.ndarray] = None
+        self._gather_jit = _compiled_kernels()[1]
+        if self._gather_jit is not None:
+            # convertScaleAbs on every possible raw depth value gives exactly
+            # the same scaled input the two-pass version would produce.
+            scaled = cv2.convertScaleAbs(
+                np.arange(65536, dtype=np.uint16).reshape(-1, 1), alpha=alpha
+            )
+            self._lut = cv2.applyColorMap(scaled, cv2.COLORMAP_JET).reshape(65536, 3)
+
+    def colorize(self, depth: np.ndarray) -> np.ndarray | cv2.UMat:
+        """Return a BGR visualization of ``depth`` scaled by ``alpha``."""
+
+        if self._use_opencl:
+            return cv2.applyColorMap(
+                cv2.convertScaleAbs(cv2.UMat(depth), alpha=self._alpha),
+                cv2.COLORMAP_JET,
+            )
+        if self._colormap is None or self._colormap.shape[:2] != depth.shape:
+            self._scaled = np.empty(depth.shape, dtype=np.uint8)
+            self._colormap = np.empty((*depth.shape, 3), dtype=np.uint8)
+        if self._lut is not None:
+            self._gather_jit(self._lut, depth, self._colormap)
+        else:
+            cv2.convertScaleAbs(depth, dst=self._scaled, alpha=self._alpha)
+            cv2.applyColorMap(self._scaled, cv2.COLORMAP_JET, dst=self._colormap)
+        return self._colormap
+
+
+class DisplayBuffer:
+    """Side-by-side composition of two equally tall images in one reused buffer."""
+
+    def __init__(self) -> None:
+        self._buffer: Optional[np.ndarray] = None
+
+    def compose(
+        self, left: np.ndarray | cv2.UMat, right: np.ndarray | cv2.UMat | None = None
+    ) -> np.ndarray:
+        """Copy ``left`` and ``right`` into the buffer and return it.
+
+        Passing ``right=None`` keeps the right half from the previous call, so
+        a slowly refreshed view costs nothing on the frames in between.
+        """
+
+        left = left.get() if isinstance(left, cv2.UMat) else left
+        right = right.get() if isinstance(right, cv2.UMat) else right
+        height, width = left.shape[:2]
+        right_width = right.shape[1] if right is not None else width
+        shape = (height, width + right_width, 3)
+        if self._buffer is None or self._buffer.shape != shape:
+            self._buffer = np.zeros(shape, dtype=np.uint8)
+        np.copyto(self._buffer[:, :width], left)
+        if right is not None:
+            np.copyto(self._buffer[:, width:], right)
+        return self._buffer
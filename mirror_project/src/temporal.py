@@ -0,0 +1,91 @@
+"""Temporal helpers for pose streams: landmark smoothing and motion gating."""
+from __future__ import annotations
+
+import math
+from typing import Optional
+
+import cv2
+import numpy as np
+
+
+class OneEuroFilter:
+    """Vectorized 1€ filter (Casiez et al., 2012) applied element-wise to arrays.
+
+    Slow movements are smoothed with a low cutoff to suppress jitter, while the
+    cutoff rises with speed (scaled by ``beta``) to keep fast motion responsive.
+    Values are expected in normalized image units and timestamps in seconds.
+    """
+
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 5.0, d_cutoff: float = 1.0) -> None:
+        self._min_cutoff = min_cutoff
+        self._beta = beta
+        self._d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self) -> None:
+        self._value: Optional[np.ndarray] = None
+        self._derivative: Optional[np.ndarray] = None
+        self._timestamp = 0.0
+
+    def __call__(self, value: np.ndarray, timestamp: float) -> np.ndarray:
+        """Filter ``value`` observed at ``timestamp`` and return the smoothed array."""
+
+        if self._value is None or self._value.shape != value.shape:
+            self._value = np.array(value, dtype=np.float32)
+            self._derivative = np.zeros_like(self._value)
+            self._timestamp = timestamp
+            return self._value.copy()
+
+        dt = timestamp - self._timestamp
+        if dt <= 0.0:
+            return self._value.copy()
+        self._timestamp = timestamp
+
+        alpha_d = _smoothing_factor(dt, self._d_cutoff)
+        derivative = (value - self._value) / dt
+        self._derivative += alpha_d * (derivative - self._derivative)
+
+        cutoff = self._min_cutoff + self._beta * np.abs(self._derivative)
+        alpha = _smoothing_factor(dt, cutoff)
+        self._value += alpha * (value - self._value)
+        return self._value.copy()
+
+
+class MotionDetector:
+    """Cheap global motion estimate on a small grayscale thumbnail.
+
+    :meth:`measure` compares the current frame against the reference set by
+    the last :meth:`commit`, so slow drift accumulates instead of slipping
+    under the threshold one frame at a time.
+    """
+
+    def __init__(self, size: int = 64) -> None:
+        self._size = (size, size)
+        self._small = np.empty((size, size, 3), dtype=np.uint8)
+        self._current = np.empty((size, size), dtype=np.uint8)
+        self._reference: Optional[np.ndarray] = None
+
+    def measure(self, frame: np.ndarray) -> float:
+        """Return the mean absolute gray-level change since the reference frame."""
+
+        cv2.resize(frame, self._size, dst=self._small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._current)
+        if self._reference is None:
+            return math.inf
+        return float(cv2.absdiff(self._current, self._reference).mean())
+
+    def commit(self) -> None:
+        """Use the last measured frame as the new reference."""
+
+        if self._reference is None:
+            self._reference = self._current.copy()
+        else:
+            self._reference, self._current = self._current, self._reference
+
+    def reset(self) -> None:
+        self._reference = None
+
+
+def _smoothing_factor(dt: float, cutoff):
+    tau = 1.0 / (2.0 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
@@ -0,0 +1,5 @@
+"""Make ``src`` importable the way ``mirror_main.py`` imports it."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,72 @@
+"""Stand-in pose backends that need no model file or inference runtime."""
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import numpy as np
+
+from src.inference import NUM_LANDMARKS, LandmarkModelBackend
+
+
+class BrightRegionBackend(LandmarkModelBackend):
+    """Landmark "model" reporting the bounding box of the bright input pixels.
+
+    Landmark 0 is the top-left and landmark 1 the bottom-right corner of the
+    box, in input pixels, and the rest sit at its center. Images without
+    bright pixels count as no pose. The shape of every image passed to
+    :meth:`process` is kept in ``seen_shapes``.
+    """
+
+    def __init__(
+        self, input_size: int = 128, channels_first: bool = False, max_batch: int = 1
+    ) -> None:
+        super().__init__(
+            input_size=input_size, channels_first=channels_first, max_batch=max_batch
+        )
+        self.seen_shapes: List[Tuple[int, ...]] = []
+
+    def process(self, rgb: np.ndarray):
+        self.seen_shapes.append(rgb.shape)
+        return super().process(rgb)
+
+    def _run(self, tensor: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        landmarks = np.zeros((len(tensor), NUM_LANDMARKS, 5), dtype=np.float32)
+        presence = np.zeros((len(tensor), 1), dtype=np.float32)
+        channel_axis = 0 if self._channels_first else -1
+        for i, image in enumerate(tensor):
+            ys, xs = np.nonzero(image.max(axis=channel_axis) > 0.5)
+            if not len(xs):
+                continue
+            x0, y0, x1, y1 = xs.min(), ys.min(), xs.max() + 1, ys.max() + 1
+            landmarks[i, :, :2] = ((x0 + x1) / 2, (y0 + y1) / 2)
+            landmarks[i, 0, :2] = (x0, y0)
+            landmarks[i, 1, :2] = (x1, y1)
+            landmarks[i, :, 3] = 10.0
+            presence[i] = 1.0
+        return landmarks.reshape(len(tensor), -1), presence
+
+
+class FixedPoseBackend:
+    """Stateful-style backend returning the same normalized pose every call."""
+
+    def __init__(self, points: np.ndarray) -> None:
+        self._points = points
+        self.seen_shapes: List[Tuple[int, ...]] = []
+
+    def process(self, rgb: np.ndarray):
+        self.seen_shapes.append(rgb.shape)
+        return self._points.copy()
+
+    def close(self) -> None:
+        pass
+
+
+def bright_box_frame(
+    height: int, width: int, box: Tuple[int, int, int, int]
+) -> np.ndarray:
+    """Return a black BGR frame with a white ``(x0, y0, x1, y1)`` rectangle."""
+
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    x0, y0, x1, y1 = box
+    frame[y0:y1, x0:x1] = 255
+    return frame
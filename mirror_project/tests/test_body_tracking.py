@@ -0,0 +1,224 @@
+import numpy as np
+import pytest
+
+from src.body_tracking import LandmarkArray, PoseEstimator, PoseLandmark, PoseResult
+
+from .fakes import BrightRegionBackend, FixedPoseBackend, bright_box_frame
+
+
+def _points(count: int = 5) -> np.ndarray:
+    return np.arange(count * 4, dtype=np.float32).reshape(count, 4) / 100
+
+
+def test_landmark_array_indexing():
+    points = _points()
+    landmarks = LandmarkArray(points)
+
+    assert len(landmarks) == 5
+    assert landmarks.data is points
+    assert landmarks[1] == PoseLandmark(*points[1].tolist())
+    assert landmarks[-1] == PoseLandmark(*points[4].tolist())
+    assert landmarks[1:4:2] == [landmarks[1], landmarks[3]]
+    assert list(landmarks) == [landmarks[i] for i in range(5)]
+    with pytest.raises(IndexError):
+        landmarks[5]
+
+
+def test_pose_result_round_trips_landmarks():
+    points = _points()
+    result = PoseResult.from_landmarks(PoseResult(points, 480, 640).landmarks, 480, 640)
+    np.testing.assert_array_equal(result.as_ndarray(), points)
+
+
+def test_pose_result_equality_compares_values():
+    result = PoseResult(_points(), 480, 640)
+
+    assert result == PoseResult(_points(), 480, 640)
+    assert result != PoseResult(_points(), 480, 320)
+    assert result != PoseResult(_points() + 0.5, 480, 640)
+    assert result != PoseResult(_points(4), 480, 640)
+    assert result != "pose"
+
+
+def _estimator(backend, **kwargs) -> PoseEstimator:
+    return PoseEstimator(
+        backend=backend, infer_size=None, smoothing=False, motion_threshold=None, **kwargs
+    )
+
+
+def _spread_pose() -> np.ndarray:
+    points = np.tile(np.float32([0.5, 0.5, 0.0, 1.0]), (33, 1))
+    points[0, :2] = 0.3
+    points[1, :2] = 0.7
+    return points
+
+
+def test_roi_crop_landmarks_are_remapped_to_full_frame():
+    box = (100, 60, 180, 200)
+    frame = bright_box_frame(240, 320, box)
+    backend = BrightRegionBackend()
+    estimator = _estimator(backend)
+
+    full = estimator.estimate(frame)
+    cropped = estimator.estimate(frame)
+
+    assert backend.seen_shapes[0] == frame.shape
+    assert backend.seen_shapes[1][0] < 240 and backend.seen_shapes[1][1] < 320
+    expected = np.array([[box[0] / 320, box[1] / 240], [box[2] / 320, box[3] / 240]])
+    np.testing.assert_allclose(full.xyzv[:2, :2], expected, atol=0.02)
+    np.testing.assert_allclose(cropped.xyzv[:2, :2], expected, atol=0.01)
+
+
+def test_roi_crop_is_refreshed_on_the_full_frame_after_the_interval():
+    frame = bright_box_frame(240, 320, (100, 60, 180, 200))
+    backend = BrightRegionBackend()
+    estimator = _estimator(backend, roi_refresh_interval=2)
+
+    for _ in range(4):
+        estimator.estimate(frame)
+
+    full = [shape == frame.shape for shape in backend.seen_shapes]
+    assert full == [True, False, False, True]
+
+
+def test_roi_crop_is_off_by_default_for_tracking_backends():
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+    backend = FixedPoseBackend(_spread_pose())
+    estimator = _estimator(backend)
+
+    for _ in range(3):
+        estimator.estimate(frame)
+
+    assert backend.seen_shapes == [frame.shape] * 3
+
+
+def test_explicit_roi_refresh_interval_is_honored_for_any_backend():
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+    backend = FixedPoseBackend(_spread_pose())
+    estimator = _estimator(backend, roi_refresh_interval=15)
+
+    estimator.estimate(frame)
+    estimator.estimate(frame)
+
+    assert backend.seen_shapes[0] == frame.shape
+    assert backend.seen_shapes[1] != frame.shape
+
+
+def test_zero_roi_refresh_interval_disables_the_crop():
+    frame = bright_box_frame(240, 320, (100, 60, 180, 200))
+    backend = BrightRegionBackend()
+    estimator = _estimator(backend, roi_refresh_interval=0)
+
+    for _ in range(3):
+        estimator.estimate(frame)
+
+    assert backend.seen_shapes == [frame.shape] * 3
+
+
+def _box_frames():
+    boxes = [(20, 30, 120, 200), (150, 40, 260, 220), None, (60, 10, 300, 120), (0, 0, 80, 80)]
+    return [
+        bright_box_frame(240, 320, box) if box else np.zeros((240, 320, 3), dtype=np.uint8)
+        for box in boxes
+    ]
+
+
+def test_batch_estimate_matches_per_frame_results():
+    frames = _box_frames()
+    # Five frames in batches of two leave a final partial batch.
+    batched = list(PoseEstimator(backend=BrightRegionBackend(max_batch=2)).batch_estimate(frames))
+    reference = _estimator(BrightRegionBackend(), roi_refresh_interval=0)
+
+    assert len(batched) == len(frames)
+    for frame, result in zip(frames, batched):
+        expected = reference.estimate(frame)
+        if expected is None:
+            assert result is None
+        else:
+            np.testing.assert_array_equal(result.xyzv, expected.xyzv)
+            assert (result.image_height, result.image_width) == (240, 320)
+
+
+def test_batch_estimate_leaves_streaming_state_untouched():
+    frame = bright_box_frame(240, 320, (100, 60, 180, 200))
+    estimator = PoseEstimator(backend=BrightRegionBackend(max_batch=2), motion_threshold=None)
+    estimator.estimate(frame)
+    ring, index = estimator.history
+    ring, window = ring.copy(), estimator.recent_window()
+    smoother_state = {key: np.copy(value) for key, value in vars(estimator._filter).items()}
+    roi = estimator._roi
+
+    assert len(list(estimator.batch_estimate(_box_frames()))) == 5
+
+    np.testing.assert_array_equal(estimator.history[0], ring)
+    assert estimator.history[1] == index
+    np.testing.assert_array_equal(estimator.recent_window(), window)
+    for key, value in vars(estimator._filter).items():
+        np.testing.assert_array_equal(value, smoother_state[key])
+    assert estimator._roi == roi
+
+
+class _CountingBackend:
+    """Returns ``count`` landmarks whose values encode the call number."""
+
+    def __init__(self, count: int = 33) -> None:
+        self.count = count
+        self.calls = 0
+
+    def process(self, rgb: np.ndarray):
+        self.calls += 1
+        return np.full((self.count, 4), self.calls, dtype=np.float32)
+
+    def close(self) -> None:
+        pass
+
+
+def _estimate_blank_frames(estimator: PoseEstimator, frames: int) -> None:
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    for _ in range(frames):
+        estimator.estimate(frame)
+
+
+def test_recent_window_is_partial_until_the_ring_fills():
+    estimator = _estimator(_CountingBackend(), history_length=4)
+    assert estimator.recent_window().shape == (0, 0, 4)
+
+    _estimate_blank_frames(estimator, 3)
+
+    window = estimator.recent_window()
+    assert window.shape == (3, 33, 4)
+    np.testing.assert_array_equal(window[:, 0, 0], [1, 2, 3])
+
+
+def test_recent_window_is_oldest_first_after_wrapping():
+    estimator = _estimator(_CountingBackend(), history_length=4)
+
+    _estimate_blank_frames(estimator, 6)
+
+    ring, index = estimator.history
+    assert index == 2
+    np.testing.assert_array_equal(ring[:, 0, 0], [5, 6, 3, 4])
+    np.testing.assert_array_equal(estimator.recent_window()[:, 0, 0], [3, 4, 5, 6])
+
+
+def test_history_is_resized_when_the_landmark_count_changes():
+    backend = _CountingBackend(count=25)
+    estimator = _estimator(backend, history_length=3)
+    _estimate_blank_frames(estimator, 2)
+    assert estimator.recent_window().shape == (2, 25, 4)
+
+    backend.count = 33
+    _estimate_blank_frames(estimator, 1)
+
+    window = estimator.recent_window()
+    assert window.shape == (1, 33, 4)
+    np.testing.assert_array_equal(window[0, :, 0], 3)
+
+
+def test_zero_history_length_keeps_no_history():
+    estimator = _estimator(_CountingBackend(), history_length=0)
+
+    _estimate_blank_frames(estimator, 3)
+
+    assert estimator.history[0].shape[0] == 0
+    assert estimator.recent_window().shape[0] == 0
@@ -0,0 +1,129 @@
+import threading
+import time
+from collections import deque
+from typing import Deque
+
+import numpy as np
+import pytest
+
+from src.capture import FrameGrabber
+
+
+class _FakeSession:
+    """Stands in for :class:`CaptureSession` with frames fed by the test.
+
+    Like the SDK, every read reuses one color/depth buffer, filled with the
+    frame number. ``drained`` is set by a read that finds nothing queued once
+    every fed frame has been returned; the single producer thread only reads
+    again after buffering the previous frame, so all of them are buffered.
+    """
+
+    def __init__(self, shape=(4, 6)) -> None:
+        self._color = np.zeros((*shape, 3), dtype=np.uint8)
+        self._depth = np.zeros(shape, dtype=np.uint16)
+        self._pending: Deque[int] = deque()
+        self._fed = 0
+        self._returned = 0
+        self._lock = threading.Lock()
+        self.drained = threading.Event()
+        self.read_kwargs = []
+        self.error = None
+
+    def feed(self, *numbers: int) -> None:
+        with self._lock:
+            self._pending.extend(numbers)
+            self._fed += len(numbers)
+            self.drained.clear()
+        assert self.drained.wait(2.0), "producer did not consume the fed frames"
+
+    def read(self, timeout_ms=None, copy=True):
+        self.read_kwargs.append((timeout_ms, copy))
+        if self.error is not None:
+            raise self.error
+        with self._lock:
+            if self._pending:
+                number = self._pending.popleft()
+                self._returned += 1
+            else:
+                number = None
+                if self._returned == self._fed:
+                    self.drained.set()
+        if number is None:
+            time.sleep(timeout_ms / 1000)
+            return None
+        self._color.fill(number)
+        self._depth.fill(number)
+        return self._color, self._depth
+
+
+def _number(pair) -> int:
+    color, depth = pair
+    assert (color == color.flat[0]).all() and (depth == color.flat[0]).all()
+    return int(color.flat[0])
+
+
+@pytest.fixture
+def session():
+    return _FakeSession()
+
+
+def test_latest_returns_newest_pair_and_drops_older_ones(session):
+    with FrameGrabber(session, maxlen=2) as grabber:
+        session.feed(1, 2, 3)
+
+        assert _number(grabber.latest(timeout=1.0)) == 3
+        assert grabber.latest(timeout=0.05) is None
+
+
+def test_held_pair_is_not_overwritten_by_later_frames(session):
+    with FrameGrabber(session, maxlen=2) as grabber:
+        session.feed(1)
+        held = grabber.latest(timeout=1.0)
+
+        session.feed(*range(2, 12))
+
+        assert _number(held) == 1
+        assert _number(grabber.latest(timeout=1.0)) == 11
+
+
+def test_frames_are_copied_into_a_bounded_buffer_pool(session):
+    maxlen = 2
+    seen = set()
+    with FrameGrabber(session, maxlen=maxlen) as grabber:
+        for start in range(1, 60, 5):
+            session.feed(*range(start, start + 5))
+            color, depth = grabber.latest(timeout=1.0)
+            assert color is not session._color and depth is not session._depth
+            seen.add(id(color))
+
+    # Queued pairs, the held pair and the one being written.
+    assert len(seen) <= maxlen + 2
+
+
+def test_producer_polls_the_session_without_copying(session):
+    with FrameGrabber(session, poll_timeout_ms=7) as grabber:
+        session.feed(1)
+        grabber.latest(timeout=1.0)
+
+    assert session.read_kwargs
+    assert set(session.read_kwargs) == {(7, False)}
+
+
+def test_capture_errors_are_raised_to_the_consumer(session):
+    session.error = OSError("device lost")
+    with FrameGrabber(session) as grabber:
+        with pytest.raises(RuntimeError) as excinfo:
+            grabber.latest(timeout=1.0)
+
+    assert excinfo.value.__cause__ is session.error
+
+
+def test_stop_ends_the_producer_thread(session):
+    grabber = FrameGrabber(session)
+    grabber.start()
+    thread = grabber._thread
+
+    grabber.stop()
+
+    assert not thread.is_alive()
+    assert list(grabber.frames()) == []
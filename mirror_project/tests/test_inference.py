@@ -0,0 +1,112 @@
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.inference import OnnxPoseBackend
+
+from .fakes import BrightRegionBackend, bright_box_frame
+
+
+@pytest.mark.parametrize("channels_first", [False, True])
+@pytest.mark.parametrize("shape", [(90, 160), (160, 90)])
+def test_letterboxed_landmarks_are_normalized_to_the_image(shape, channels_first):
+    height, width = shape
+    box = (width // 4, height // 4, width * 5 // 8, height * 2 // 3)
+    backend = BrightRegionBackend(channels_first=channels_first)
+
+    points = backend.process(bright_box_frame(height, width, box))
+
+    expected = np.array([[box[0] / width, box[1] / height], [box[2] / width, box[3] / height]])
+    np.testing.assert_allclose(points[:2, :2], expected, atol=0.02)
+    assert points[:, 3].min() > 0.99
+
+
+def test_missing_pose_returns_none():
+    backend = BrightRegionBackend()
+    assert backend.process(np.zeros((90, 160, 3), dtype=np.uint8)) is None
+
+
+class _StubSession:
+    """Mimics the shape checking of ``onnxruntime.InferenceSession.run``."""
+
+    def __init__(self, batch, size: int = 64) -> None:
+        self._shape = (batch, size, size, 3)
+
+    def get_inputs(self):
+        return [SimpleNamespace(name="input", shape=list(self._shape))]
+
+    def get_outputs(self):
+        return [SimpleNamespace(name="landmarks"), SimpleNamespace(name="presence")]
+
+    def run(self, output_names, feeds):
+        tensor = feeds["input"]
+        expected = self._shape[0]
+        if isinstance(expected, int) and len(tensor) != expected:
+            raise ValueError(
+                f"Got invalid dimensions for input: index 0 Got {len(tensor)} Expected {expected}"
+            )
+        # Encode each row's mean brightness in its landmark x so results can be told apart.
+        landmarks = np.zeros((len(tensor), 33 * 5), dtype=np.float32)
+        landmarks[:, 0] = tensor.reshape(len(tensor), -1).mean(axis=1) * 64
+        return landmarks, np.ones((len(tensor), 1), dtype=np.float32)
+
+
+@pytest.fixture
+def stub_onnxruntime(monkeypatch):
+    def install(batch):
+        module = SimpleNamespace(
+            SessionOptions=SimpleNamespace,
+            GraphOptimizationLevel=SimpleNamespace(ORT_ENABLE_ALL=99),
+            get_available_providers=lambda: ["CPUExecutionProvider"],
+            InferenceSession=lambda *args, **kwargs: _StubSession(batch),
+        )
+        monkeypatch.setitem(sys.modules, "onnxruntime", module)
+
+    return install
+
+
+def _gray_frames(*levels):
+    return [np.full((64, 64, 3), level, dtype=np.uint8) for level in levels]
+
+
+def test_onnx_fixed_batch_export_pads_smaller_batches(stub_onnxruntime):
+    stub_onnxruntime(4)
+    backend = OnnxPoseBackend("pose.onnx", max_batch=2)
+    assert backend.max_batch == 4
+
+    single = [backend.process(frame)[0, 0] for frame in _gray_frames(51, 102, 204)]
+    batched = [points[0, 0] for points in backend.process_batch(_gray_frames(51, 102, 204))]
+
+    np.testing.assert_allclose(single, [0.2, 0.4, 0.8], atol=1e-6)
+    np.testing.assert_allclose(batched, single, atol=1e-6)
+
+
+def test_onnx_dynamic_batch_export_uses_requested_max_batch(stub_onnxruntime):
+    stub_onnxruntime("batch")
+    backend = OnnxPoseBackend("pose.onnx", max_batch=3)
+
+    assert backend.max_batch == 3
+    assert len(backend.process_batch(_gray_frames(10, 20))) == 2
+
+
+def test_batch_matches_single_image_results():
+    frames = [
+        bright_box_frame(90, 160, (10, 10, 60, 80)),
+        np.zeros((90, 160, 3), dtype=np.uint8),
+        bright_box_frame(120, 100, (30, 20, 90, 100)),
+    ]
+    backend = BrightRegionBackend(max_batch=len(frames))
+
+    batched = backend.process_batch(frames)
+
+    assert batched[1] is None
+    for frame, points in zip(frames[::2], batched[::2]):
+        np.testing.assert_array_equal(points, backend.process(frame))
+
+
+def test_batch_larger_than_max_batch_is_rejected():
+    backend = BrightRegionBackend(max_batch=2)
+    with pytest.raises(ValueError):
+        backend.process_batch(_gray_frames(0, 0, 0))
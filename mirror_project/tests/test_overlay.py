@@ -0,0 +1,37 @@
+import cv2
+import numpy as np
+import pytest
+
+from src.overlay import DepthColorizer
+
+
+def _two_pass(depth: np.ndarray, alpha: float) -> np.ndarray:
+    return cv2.applyColorMap(cv2.convertScaleAbs(depth, alpha=alpha), cv2.COLORMAP_JET)
+
+
+@pytest.mark.parametrize("alpha", [0.03, 0.1])
+def test_colorize_matches_two_pass_colormap_for_every_depth(alpha):
+    # A 256x256 image holds each of the 65536 raw depth values exactly once.
+    depth = np.arange(65536, dtype=np.uint16).reshape(256, 256)
+
+    colormap = DepthColorizer(alpha=alpha).colorize(depth)
+
+    np.testing.assert_array_equal(colormap, _two_pass(depth, alpha))
+
+
+def test_colorize_reuses_output_buffer_until_shape_changes():
+    colorizer = DepthColorizer()
+    first = colorizer.colorize(np.zeros((48, 64), dtype=np.uint16))
+    second = colorizer.colorize(np.full((48, 64), 4000, dtype=np.uint16))
+    third = colorizer.colorize(np.zeros((24, 32), dtype=np.uint16))
+
+    assert first is second
+    assert third.shape == (24, 32, 3)
+
+
+def test_opencl_colorize_matches_cpu_result():
+    depth = np.random.default_rng(0).integers(0, 65536, size=(48, 64), dtype=np.uint16)
+
+    colormap = DepthColorizer(use_opencl=True).colorize(depth)
+
+    np.testing.assert_array_equal(colormap.get(), _two_pass(depth, 0.03))
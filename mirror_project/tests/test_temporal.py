@@ -0,0 +1,63 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.temporal import MotionDetector, OneEuroFilter
+
+
+def test_one_euro_filter_converges_to_constant_input():
+    smoother = OneEuroFilter()
+    smoother(np.zeros(3, dtype=np.float32), 0.0)
+    target = np.array([0.2, 0.5, 0.8], dtype=np.float32)
+    for step in range(1, 61):
+        result = smoother(target, step / 30.0)
+    np.testing.assert_allclose(result, target, atol=1e-3)
+
+
+def test_one_euro_filter_damps_jitter():
+    rng = np.random.default_rng(0)
+    noisy = 0.5 + rng.normal(scale=0.01, size=(120, 33)).astype(np.float32)
+    smoother = OneEuroFilter()
+    smoothed = np.array([smoother(row, step / 30.0) for step, row in enumerate(noisy)])
+    assert smoothed[30:].std() < noisy[30:].std() / 2
+
+
+def test_one_euro_filter_reset_restarts_from_next_value():
+    smoother = OneEuroFilter()
+    smoother(np.zeros(2, dtype=np.float32), 0.0)
+    smoother(np.ones(2, dtype=np.float32), 0.1)
+    smoother.reset()
+    value = np.array([0.3, 0.7], dtype=np.float32)
+    np.testing.assert_array_equal(smoother(value, 0.2), value)
+
+
+def test_one_euro_filter_repeated_timestamp_returns_previous_value():
+    smoother = OneEuroFilter()
+    first = smoother(np.full(2, 0.4, dtype=np.float32), 1.0)
+    np.testing.assert_array_equal(smoother(np.ones(2, dtype=np.float32), 1.0), first)
+
+
+def test_motion_detector_measures_against_committed_reference():
+    still = np.full((120, 160, 3), 100, dtype=np.uint8)
+    moved = np.full((120, 160, 3), 140, dtype=np.uint8)
+    detector = MotionDetector()
+
+    assert detector.measure(still) == math.inf
+    detector.commit()
+    assert detector.measure(still) == 0.0
+
+    # Without a commit the reference stays put, so the change keeps counting.
+    assert detector.measure(moved) == pytest.approx(40.0)
+    assert detector.measure(moved) == pytest.approx(40.0)
+    detector.commit()
+    assert detector.measure(moved) == 0.0
+
+
+def test_motion_detector_reset_drops_reference():
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    detector = MotionDetector()
+    detector.measure(frame)
+    detector.commit()
+    detector.reset()
+    assert detector.measure(frame) == math.inf